@@ -1,13 +1,35 @@
 from journal_app.persistence import FileJournalRepository
 from journal_app.entry import (
     JournalEntry, NoteEntry, TaskEntry, EventEntry, HabitEntry,
-    Signifier, TaskStatus
+    Signifier, TaskStatus, TS_KEY
 )
-from datetime import datetime, date, timedelta
+from datetime import datetime, date, time, timedelta
 from typing import List, Type # <--- FIXED: changed 'type' to 'Type'
 import sys 
-import calendar # For monthly view
-from tabulate import tabulate # <--- ADDED IMPORT
+import logging
+import bisect
+from collections import defaultdict
+
+# Instructional placeholder text shown in a brand-new journal
+WELCOME_TEXT = "Welcome to your CLI Bullet Journal! Start by pressing 'A' to Add an entry."
+TASK_TEXT = "Task: Press 'X' or 'M' and the index number to mark me as Complete (X) or Migrated (>)."
+EVENT_TEXT = "Event: Press 'C' and the index number to mark me as Complete (✓)."
+HABIT_TEXT = "Habit: Press 'H' and the index number to mark me as complete for TODAY."
+SPREADS_TEXT = "View your Spreads: Press 'V' to see the Weekly, Monthly, and Habit Tracker views."
+
+# Reverse lookup for signifier input, built once instead of scanning the enum
+_SIG_BY_VALUE = {s.value: s for s in Signifier}
+
+
+def _render_table(headers: List[str], rows: List[List[str]]) -> str:
+    """Renders rows of strings as a simple aligned table (single width pass, no tabulate)."""
+    widths = [max([len(h)] + [len(row[i]) for row in rows]) for i, h in enumerate(headers)]
+    lines = [
+        " | ".join(h.ljust(w) for h, w in zip(headers, widths)).rstrip(),
+        "-+-".join("-" * w for w in widths),
+    ]
+    lines.extend(" | ".join(cell.ljust(w) for cell, w in zip(row, widths)).rstrip() for row in rows)
+    return "\n".join(lines)
 
 # =========================================================================
 # APPLICATION CORE
@@ -21,9 +43,30 @@ class BulletJournalCLI:
         self.entries: list[JournalEntry] = self.repository.load_entries()
         
         if not self.entries:
+            # Samples are built newest-first, so only the bisect keys are needed
             self.entries = self._create_sample_entries()
-        
-        self._sort_entries()
+            self._rebuild_keys()
+        else:
+            self._sort_entries()
+
+        # Bumped on every mutation so cached spread rows know when to rebuild
+        self._entries_version = 0
+        self._view_cache: dict = {}
+        # Rendered journal rows (minus the index) keyed by id(entry); cleared
+        # daily because habit symbols depend on today's date
+        self._row_cache: dict[int, str] = {}
+        self._row_cache_day = date.today()
+
+        # Single-letter menu commands mapped to their handlers
+        self._actions = {
+            'Q': self.quit_app,
+            'A': self.add_entry,
+            'X': self.complete_task,
+            'M': self.migrate_task,
+            'H': self.mark_habit_complete,
+            'C': self.complete_event,
+            'V': self.view_spreads,
+        }
 
     def _create_sample_entries(self) -> List[JournalEntry]:
         """Creates instructional placeholder entries for a new journal."""
@@ -32,77 +75,78 @@ class BulletJournalCLI:
         
         return [
             NoteEntry(
-                content="Welcome to your CLI Bullet Journal! Start by pressing 'A' to Add an entry.",
+                content=WELCOME_TEXT,
                 signifier=Signifier.INSPIRATION, # !
                 timestamp=today
             ),
             TaskEntry(
-                content="Task: Press 'X' or 'M' and the index number to mark me as Complete (X) or Migrated (>).",
+                content=TASK_TEXT,
                 status=TaskStatus.INCOMPLETE,
                 signifier=Signifier.PRIORITY, # *
                 timestamp=today
             ),
             EventEntry(
-                content="Event: Press 'C' and the index number to mark me as Complete (✓).",
+                content=EVENT_TEXT,
                 location="Demo Location",
                 signifier=Signifier.NONE, # O
                 timestamp=today
             ),
             HabitEntry(
-                content="Habit: Press 'H' and the index number to mark me as complete for TODAY.",
+                content=HABIT_TEXT,
                 frequency="Daily",
                 signifier=Signifier.NONE, # ◷
                 timestamp=yesterday, # Give it an older timestamp so it appears later in the list
-                completed_dates=[]
             ),
             NoteEntry(
-                content="View your Spreads: Press 'V' to see the Weekly, Monthly, and Habit Tracker views.",
+                content=SPREADS_TEXT,
                 signifier=Signifier.EXPLORE, # ?
                 timestamp=yesterday - timedelta(hours=1)
             ),
         ]
+
     def _sort_entries(self) -> None:
-        """Sorts entries by timestamp"""
-        self.entries.sort(key=lambda e: e.timestamp, reverse=True)
+        """Sorts entries by timestamp and rebuilds the parallel bisect keys."""
+        self.entries.sort(key=TS_KEY, reverse=True)
+        self._rebuild_keys()
+
+    def _rebuild_keys(self) -> None:
+        """Rebuilds the bisect keys for the (already newest-first) entries."""
+        # Negated timestamps keep the keys ascending while entries stay newest-first
+        self._keys = [-e.timestamp.timestamp() for e in self.entries]
+
+    def _insert_entry(self, entry: JournalEntry) -> None:
+        """Inserts an entry at its sorted position without re-sorting the journal."""
+        key = -entry.timestamp.timestamp()
+        # New entries are almost always the newest, which belong at the front
+        if not self._keys or key <= self._keys[0]:
+            idx = 0
+        else:
+            idx = bisect.bisect_left(self._keys, key)
+        self._keys.insert(idx, key)
+        self.entries.insert(idx, entry)
+
+    def _entries_between(self, start: date, end: date) -> List[JournalEntry]:
+        """Returns entries dated within [start, end], oldest first, via bisect on the sorted keys."""
+        lo_key = -datetime.combine(end, time.max).timestamp()
+        hi_key = -datetime.combine(start, time.min).timestamp()
+        lo = bisect.bisect_left(self._keys, lo_key)
+        hi = bisect.bisect_right(self._keys, hi_key)
+        return self.entries[lo:hi][::-1]
 
     def _format_entry(self, entry: JournalEntry, index: int) -> str:
         """Formats a single entry for CLI output."""
-        
-        date_str = entry.timestamp.strftime('%Y-%m-%d')
-        time_str = entry.timestamp.strftime('%H:%M')
-        signifier = entry.signifier.value if entry.signifier.value else " "
-        content = entry.content
-        symbol = " " 
-        entry_type = entry.type
-        
-        if isinstance(entry, TaskEntry):
-            symbol = entry.status.value
-            
-        elif isinstance(entry, EventEntry):
-            # NEW: Check completion status
-            symbol = "✓" if entry.is_completed else "○" 
-            content += f" @ {entry.location}" if entry.location else ""
-        
-        elif isinstance(entry, HabitEntry):
-            # Show checkmark if completed today, otherwise show habit symbol
-            symbol = "✓" if entry.is_completed_today() else "◷" 
-            
-        else: # NoteEntry
-            symbol = "−"
+        row = self._row_cache.get(id(entry))
+        if row is None:
+            row = entry.format_display()
+            self._row_cache[id(entry)] = row
             
         # Format: [Index] [Date] [Time] [Symbol][Signifier] Content
-        return f"[{index:02}] {date_str} {time_str} {symbol}{signifier} {content} ({entry_type})"
-
-    def _get_simple_symbol(self, entry: JournalEntry) -> str:
-        """Helper to get only the core symbol for spreads."""
-        if isinstance(entry, TaskEntry):
-            return entry.status.value
-        elif isinstance(entry, EventEntry):
-            return "✓" if entry.is_completed else "○" 
-        elif isinstance(entry, HabitEntry):
-            return "✓" if entry.is_completed_today() else "◷"
-        else:
-            return "−"
+        return f"[{index:02}] {row}"
+
+    def _entry_changed(self, entry: JournalEntry) -> None:
+        """Invalidates cached renders after an entry is mutated in place."""
+        self._entries_version += 1
+        self._row_cache.pop(id(entry), None)
 
     # --- CLI Loop & Menu ---
     
@@ -112,26 +156,13 @@ class BulletJournalCLI:
         print("\n **CLI BULLET JOURNAL**\n")
         
         while True:
-            self._sort_entries()
             self.display_journal()
             
             action = self._display_menu()
             
-            if action == 'Q':
-                self.quit_app()
-            elif action == 'A':
-                self.add_entry()
-            elif action == 'X':
-                self.complete_task()
-            elif action == 'M':
-                self.migrate_task()
-            elif action == 'H':
-                self.mark_habit_complete()
-            # NEW ACTIONS
-            elif action == 'C':
-                self.complete_event()
-            elif action == 'V':
-                self.view_spreads()
+            handler = self._actions.get(action)
+            if handler:
+                handler()
             else:
                 print("Invalid action. Please try again.")
 
@@ -142,8 +173,12 @@ class BulletJournalCLI:
         if not self.entries:
             print("  No entries yet. Press 'A' to add one.")
         else:
-            for i, entry in enumerate(self.entries):
-                print(self._format_entry(entry, i + 1))
+            today = date.today()
+            if today != self._row_cache_day:
+                self._row_cache.clear()
+                self._row_cache_day = today
+            # One joined write instead of a print() call per row
+            print("\n".join(self._format_entry(entry, i) for i, entry in enumerate(self.entries, start=1)))
         print("-" * 50)
 
     def _display_menu(self) -> str:
@@ -168,29 +203,31 @@ class BulletJournalCLI:
             return
             
         sig_input = input("Signifier (*, !, ? or [Enter] for None): ").strip()
-        signifier = next(
-            (s for s in Signifier if s.value == sig_input), 
-            Signifier.NONE
-        )
+        signifier = _SIG_BY_VALUE.get(sig_input, Signifier.NONE)
 
         new_entry = None
+        # Captured once and passed explicitly instead of each dataclass default_factory
+        now = datetime.now()
         
         if entry_type == 'N':
-            new_entry = NoteEntry(content=content, signifier=signifier)
+            new_entry = NoteEntry(content=content, signifier=signifier, timestamp=now)
         
         elif entry_type == 'T':
-            new_entry = TaskEntry(content=content, signifier=signifier, status=TaskStatus.INCOMPLETE)
+            new_entry = TaskEntry(content=content, signifier=signifier, status=TaskStatus.INCOMPLETE, timestamp=now)
             
         elif entry_type == 'E':
             location = input("Location (Optional): ").strip()
-            new_entry = EventEntry(content=content, signifier=signifier, location=location or None)
+            new_entry = EventEntry(content=content, signifier=signifier, location=location or None, timestamp=now)
         
         elif entry_type == 'H':
             frequency = input("Frequency (e.g., Daily, Weekly): ").strip()
-            new_entry = HabitEntry(content=content, signifier=signifier, frequency=frequency)
+            new_entry = HabitEntry(content=content, signifier=signifier, frequency=frequency, timestamp=now)
 
         if new_entry:
-            self.entries.append(new_entry)
+            self._insert_entry(new_entry)
+            self._entries_version += 1
+            # Appended right away; the full file is rewritten on quit
+            self.repository.append_entry(new_entry)
             print("Entry added successfully!")
 
     def _get_entry_by_index(self, prompt: str, required_type: Type) -> JournalEntry | None: # <--- FIXED: changed 'type' to 'Type'
@@ -223,6 +260,7 @@ class BulletJournalCLI:
         entry = self._get_entry_by_index("Enter index of Task to [X] Complete: ", TaskEntry)
         if entry:
             entry.complete()
+            self._entry_changed(entry)
             print(f"Task '{entry.content}' marked as {entry.status.name} (×).")
 
     def migrate_task(self):
@@ -230,6 +268,7 @@ class BulletJournalCLI:
         entry = self._get_entry_by_index("Enter index of Task to [M] Migrate: ", TaskEntry)
         if entry:
             entry.migrate()
+            self._entry_changed(entry)
             print(f"Task '{entry.content}' marked as {entry.status.name} (>).")
 
     def mark_habit_complete(self):
@@ -237,6 +276,7 @@ class BulletJournalCLI:
         entry = self._get_entry_by_index("Enter index of Habit to [H] Complete for Today: ", HabitEntry)
         if entry:
             entry.mark_complete()
+            self._entry_changed(entry)
             print(f"Habit '{entry.content}' marked as complete for today (✓).")
 
     def complete_event(self):
@@ -244,6 +284,7 @@ class BulletJournalCLI:
         entry = self._get_entry_by_index("Enter index of Event to [C] Complete: ", EventEntry)
         if entry:
             entry.complete()
+            self._entry_changed(entry)
             print(f"Event '{entry.content}' marked as complete (✓).")
 
     def view_spreads(self):
@@ -266,6 +307,10 @@ class BulletJournalCLI:
 
     def display_habit_spread(self):
         """Displays a table showing habit completion for the last 7 days."""
+        try:
+            from tabulate import tabulate # Deferred: only the habit tracker needs it
+        except ImportError: # Optional, e.g. minimal PyPy installs
+            tabulate = None
         print("\n--- HABIT TRACKER SPREAD ---")
         habit_entries = [e for e in self.entries if isinstance(e, HabitEntry)]
         
@@ -280,24 +325,74 @@ class BulletJournalCLI:
         
         # Setup the table header
         headers = ["Habit"] + [d.strftime('%a %d') for d in dates]
+        # Ordinal keys are the same for every habit, so build them once
+        date_ords = [d.toordinal() for d in dates]
 
         # Fill the table rows
         table_data = []
         for habit in habit_entries:
-            row = [habit.content]
-            
-            for d in dates:
-                is_done = d.isoformat() in habit.completed_dates
-                # Use '+' as requested in the initial requirements for completion
-                row.append("+" if is_done else " ") 
-            
+            done = habit.is_completed_on
+            # Use '+' as requested in the initial requirements for completion
+            row = [habit.content] + ["+" if done(o) else " " for o in date_ords]
             table_data.append(row)
 
-        print(tabulate(table_data, headers=headers, tablefmt="fancy_grid")) # <--- USING TABULATE
+        if tabulate:
+            print(tabulate(table_data, headers=headers, tablefmt="fancy_grid")) # <--- USING TABULATE
+        else:
+            print(_render_table(headers, table_data))
         input("Press Enter to continue...") # Pause for viewing
 
+    def _cached_view_rows(self, view: str, start: date, end: date, build_rows) -> list:
+        """Returns the table rows for a spread, rebuilding only after the journal changes."""
+        # Today is part of the key because habit symbols depend on the current day
+        key = (self._entries_version, date.today(), start, end)
+        cached = self._view_cache.get(view)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        # Oldest first, sliced straight out of the sorted journal
+        rows = build_rows(self._entries_between(start, end))
+        self._view_cache[view] = (key, rows)
+        return rows
+
+    def _build_weekly_rows(self, entries: List[JournalEntry]) -> list:
+        """Builds one weekly spread row per entry."""
+        return [
+            [
+                entry.day_abbr,
+                entry.time_hm,
+                f"{entry.render_symbol()}{entry.signifier.value}",
+                entry.content
+            ]
+            for entry in entries
+        ]
+
+    def _build_monthly_rows(self, entries: List[JournalEntry]) -> list:
+        """Builds monthly spread rows, labelling only the first row of each day."""
+        # Group entries by day of the month for better organization
+        daily_entries = defaultdict(list)
+        for entry in entries:
+            daily_entries[entry.timestamp.day].append(entry)
+
+        table_data = []
+        # Entries arrive oldest first, so insertion order is already ascending by day
+        for day in daily_entries:
+            
+            # Combine all entries for a given day into one or more rows
+            for i, entry in enumerate(daily_entries[day]):
+                # Only show the day number once per day group
+                day_str = f"DAY {day:02}" if i == 0 else "" 
+                
+                table_data.append([
+                    day_str,
+                    entry.time_hm,
+                    f"{entry.render_symbol()}{entry.signifier.value}",
+                    entry.content
+                ])
+        return table_data
+
     def display_weekly_view(self):
-        """Filters and displays entries for the current week using tabulate."""
+        """Filters and displays entries for the current week as a plain table."""
         print("\n--- WEEKLY SPREAD ---")
         today = datetime.now().date()
         # Find the start of the week (Monday)
@@ -306,35 +401,18 @@ class BulletJournalCLI:
         
         print(f"Showing entries for: {start_of_week.strftime('%Y-%m-%d')} to {end_of_week.strftime('%Y-%m-%d')}")
         
-        # Sort by date (oldest first) before filtering
-        all_entries_sorted = sorted(self.entries, key=lambda e: e.timestamp)
+        table_data = self._cached_view_rows('weekly', start_of_week, end_of_week, self._build_weekly_rows)
         
-        filtered_entries = [
-            e for e in all_entries_sorted 
-            if start_of_week <= e.timestamp.date() <= end_of_week
-        ]
-        
-        if not filtered_entries:
+        if not table_data:
             print("No entries found for this week.")
         else:
-            table_data = []
-            for entry in filtered_entries:
-                symbol = self._get_simple_symbol(entry)
-                signifier = entry.signifier.value if entry.signifier.value else ""
-                
-                table_data.append([
-                    entry.timestamp.strftime('%a %d'),
-                    entry.timestamp.strftime('%H:%M'),
-                    f"{symbol}{signifier}",
-                    entry.content
-                ])
-
-            print(tabulate(table_data, headers=["Day", "Time", "Sym", "Entry"], tablefmt="grid")) # <--- USING TABULATE
+            print(_render_table(["Day", "Time", "Sym", "Entry"], table_data))
 
         input("Press Enter to continue...")
 
     def display_monthly_view(self):
-        """Filters and displays entries for the current month using tabulate."""
+        """Filters and displays entries for the current month as a plain table."""
+        import calendar # For monthly view
         print("\n--- MONTHLY SPREAD ---")
         now = datetime.now()
         year = now.year
@@ -347,51 +425,17 @@ class BulletJournalCLI:
 
         print(f"Showing entries for: {start_of_month.strftime('%B %Y')}")
         
-        # Sort by date (oldest first) before filtering
-        all_entries_sorted = sorted(self.entries, key=lambda e: e.timestamp)
-        
-        filtered_entries = [
-            e for e in all_entries_sorted 
-            if start_of_month <= e.timestamp.date() <= end_of_month
-        ]
+        table_data = self._cached_view_rows('monthly', start_of_month, end_of_month, self._build_monthly_rows)
         
         # Print the calendar grid
         cal_str = calendar.month(year, month)
         print(cal_str)
         
-        if not filtered_entries:
-            print("-" * 20)
+        print("-" * 20)
+        if not table_data:
             print("No entries found for this month.")
         else:
-            # Group entries by day of the month for better organization
-            daily_entries = {}
-            for entry in filtered_entries:
-                day = entry.timestamp.day
-                if day not in daily_entries:
-                    daily_entries[day] = []
-                daily_entries[day].append(entry)
-
-            print("-" * 20)
-            
-            table_data = []
-            for day in sorted(daily_entries.keys()):
-                
-                # Combine all entries for a given day into one or more rows
-                for i, entry in enumerate(daily_entries[day]):
-                    symbol = self._get_simple_symbol(entry)
-                    signifier = entry.signifier.value if entry.signifier.value else ""
-                    
-                    # Only show the day number once per day group
-                    day_str = f"DAY {day:02}" if i == 0 else "" 
-                    
-                    table_data.append([
-                        day_str,
-                        entry.timestamp.strftime('%H:%M'),
-                        f"{symbol}{signifier}",
-                        entry.content
-                    ])
-            
-            print(tabulate(table_data, headers=["Day", "Time", "Sym", "Entry"], tablefmt="grid")) # <--- USING TABULATE
+            print(_render_table(["Day", "Time", "Sym", "Entry"], table_data))
         
         input("Press Enter to continue...")
 
@@ -406,5 +450,6 @@ class BulletJournalCLI:
 # =========================================================================
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     app = BulletJournalCLI()
     app.run()
@@ -1,7 +1,9 @@
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime, date
 from enum import Enum
-from typing import Optional, List
+from operator import attrgetter
+from typing import Optional, List, Set
 
 class Signifier(Enum):
     """Ryder Carroll Bullet Journal Signifiers"""
@@ -18,13 +20,56 @@ class TaskStatus(Enum):
     SCHEDULED = "<"     # Task (scheduled for future)
     IRRELEVANT = "−"    # Task (struck through/irrelevant)
 
-@dataclass
+# Signifier column for the journal list; blank signifiers keep the column aligned
+_SIGNIFIER_DISPLAY = {
+    Signifier.NONE: " ",
+    Signifier.PRIORITY: "*",
+    Signifier.INSPIRATION: "!",
+    Signifier.EXPLORE: "?",
+}
+
+# Ascending timestamp sort key shared by the app and the repository (callers
+# pass reverse=True for newest first); a C-level attrgetter avoids a Python
+# lambda frame per comparison
+TS_KEY = attrgetter('timestamp')
+
+@dataclass(slots=True)
 class JournalEntry:
     """Base class for all journal entries"""
     content: str
     type: str
     signifier: Signifier = Signifier.NONE
     timestamp: datetime = field(default_factory=datetime.now)
+    # Render strings, formatted lazily on first read and then kept;
+    # timestamp is never mutated after creation
+    _date_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _time_hm: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _day_abbr: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def date_iso(self) -> str:
+        """Returns the YYYY-MM-DD date used in the journal list."""
+        if self._date_iso is None:
+            ts = self.timestamp
+            # Plain int formatting skips strftime's locale machinery
+            self._date_iso = f"{ts.year:04d}-{ts.month:02d}-{ts.day:02d}"
+        return self._date_iso
+
+    @property
+    def time_hm(self) -> str:
+        """Returns the 24-hour HH:MM time used in the list and spreads."""
+        if self._time_hm is None:
+            ts = self.timestamp
+            self._time_hm = f"{ts.hour:02d}:{ts.minute:02d}"
+        return self._time_hm
+
+    @property
+    def day_abbr(self) -> str:
+        """Returns the weekday/day label (e.g. 'Mon 05') used in the weekly spread."""
+        if self._day_abbr is None:
+            # Only the weekday name needs the locale-aware path
+            self._day_abbr = self.timestamp.strftime('%a %d')
+        return self._day_abbr
     
     def get_date_str(self) -> str:
         """Returns formatted date string"""
@@ -34,12 +79,26 @@ class JournalEntry:
         """Returns formatted time string"""
         return self.timestamp.strftime('%I:%M %p')
 
-@dataclass
+    def render_symbol(self) -> str:
+        """Returns the core bullet symbol (notes and unknown types use −)."""
+        return "−"
+
+    def render_content(self) -> str:
+        """Returns the content text as shown in the journal list."""
+        return self.content
+
+    def format_display(self) -> str:
+        """Returns the journal list row: [Date] [Time] [Symbol][Signifier] Content (Type)."""
+        # Symbol and content rendering are polymorphic on the entry subclass
+        signifier = _SIGNIFIER_DISPLAY[self.signifier]
+        return f"{self.date_iso} {self.time_hm} {self.render_symbol()}{signifier} {self.render_content()} ({self.type})"
+
+@dataclass(slots=True)
 class NoteEntry(JournalEntry):
     """Simple note or thought."""
     type: str = field(default="Note", init=False)
 
-@dataclass
+@dataclass(slots=True)
 class TaskEntry(JournalEntry):
     """An action that needs to be taken."""
     status: TaskStatus = TaskStatus.INCOMPLETE
@@ -53,7 +112,11 @@ class TaskEntry(JournalEntry):
         """Mark task as migrated."""
         self.status = TaskStatus.MIGRATED
 
-@dataclass
+    def render_symbol(self) -> str:
+        """Returns the task status symbol."""
+        return self.status.value
+
+@dataclass(slots=True)
 class EventEntry(JournalEntry):
     """A scheduled event or appointment."""
     location: Optional[str] = None
@@ -65,53 +128,80 @@ class EventEntry(JournalEntry):
         """Mark event as completed/past."""
         self.is_completed = True
 
-@dataclass
+    def render_symbol(self) -> str:
+        """Returns ✓ once completed, otherwise the event circle."""
+        return "✓" if self.is_completed else "○"
+
+    def render_content(self) -> str:
+        """Returns the content with the location appended, if any."""
+        return f"{self.content} @ {self.location}" if self.location else self.content
+
+@dataclass(slots=True)
 class HabitEntry(JournalEntry):
     """A habit to be tracked daily."""
     frequency: str = "Daily"
     type: str = field(default="Habit", init=False)
-    # Stores dates when completed (YYYY-MM-DD format)
-    completed_dates: List[str] = field(default_factory=list) 
+    # Completion days as date ordinals: a compact int array for storage plus a set for O(1) lookups.
+    # Equality uses the set, since the array's append order does not survive a save/load
+    completed_ordinals: array = field(default_factory=lambda: array('i'), compare=False)
+    _completed_set: Set[int] = field(init=False, repr=False)
+    # Day ordinals sorted newest first, rebuilt lazily for get_streak
+    _ordinals_desc: Optional[List[int]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Builds the membership set from the stored ordinals."""
+        self._completed_set = set(self.completed_ordinals)
     
     def mark_complete(self, completion_date: Optional[date] = None):
         """Mark habit as completed for a specific date (defaults to today)."""
         if completion_date is None:
             completion_date = date.today()
         
-        date_str = completion_date.isoformat()
-        if date_str not in self.completed_dates:
-            self.completed_dates.append(date_str)
-            self.completed_dates.sort(reverse=True)
+        ordinal = completion_date.toordinal()
+        if ordinal not in self._completed_set:
+            self._completed_set.add(ordinal)
+            self.completed_ordinals.append(ordinal)
+            self._ordinals_desc = None
     
+    def is_completed_on(self, ordinal: int) -> bool:
+        """Check if habit was completed on the day with the given date ordinal."""
+        return ordinal in self._completed_set
+
     def is_completed_today(self) -> bool:
         """Check if habit was completed today."""
-        today = date.today().isoformat()
-        return today in self.completed_dates
+        return self.is_completed_on(date.today().toordinal())
+
+    def render_symbol(self) -> str:
+        """Returns ✓ if completed today, otherwise the habit symbol."""
+        return "✓" if self.is_completed_today() else "◷"
     
     def get_completion_count(self, start_date: date, end_date: date) -> int:
         """Get number of completions in a date range"""
-        return sum(
-            1 for date_str in self.completed_dates
-            if start_date.isoformat() <= date_str <= end_date.isoformat()
-        )
+        start, end = start_date.toordinal(), end_date.toordinal()
+        return sum(1 for ordinal in self._completed_set if start <= ordinal <= end)
     
     def get_streak(self) -> int:
         """Calculate current streak of consecutive days"""
-        if not self.completed_dates:
+        if not self._completed_set:
             return 0
         
-        sorted_dates = sorted([date.fromisoformat(d) for d in self.completed_dates], reverse=True)
-        
-        streak = 0
-        expected_date = date.today()
-        
-        for completed in sorted_dates:
-            if completed == expected_date:
-                streak += 1
-                expected_date = date.fromordinal(expected_date.toordinal() - 1)
-            elif completed < expected_date:
-                if completed != date.fromordinal(expected_date.toordinal() - 1):
-                    break
-                streak += 1
-                expected_date = date.fromordinal(expected_date.toordinal() - 1)
-        return streak
+        if self._ordinals_desc is None:
+            self._ordinals_desc = sorted(self._completed_set, reverse=True)
+        return _streak_from_ordinals(self._ordinals_desc, date.today().toordinal())
+
+
+def _streak_from_ordinals(ordinals_desc: List[int], today_ordinal: int) -> int:
+    """Counts the consecutive-day run ending today (or yesterday) using plain integer ordinals."""
+    streak = 0
+    expected = today_ordinal
+    
+    for completed in ordinals_desc:
+        if completed == expected:
+            streak += 1
+            expected -= 1
+        elif completed < expected:
+            if completed != expected - 1:
+                break
+            streak += 1
+            expected -= 1
+    return streak
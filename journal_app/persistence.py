@@ -1,23 +1,75 @@
 import json
 import os
+import shutil
 import logging
-from datetime import datetime
+from bisect import bisect_left, bisect_right
+from array import array
+from datetime import datetime, date
 from enum import Enum
-from typing import List, Union, Any, Protocol
+from functools import lru_cache
+from typing import List, Optional, Union, Any, Protocol
 from dataclasses import fields as dataclass_fields
 
 from journal_app.entry import (
     Signifier, TaskStatus, # EventSymbol, NoteSymbol, <-- REMOVED THESE
-    JournalEntry, TaskEntry, EventEntry, NoteEntry, HabitEntry
+    JournalEntry, TaskEntry, EventEntry, NoteEntry, HabitEntry, TS_KEY
 )
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
+try:
+    import orjson
+except ImportError: # Optional: fall back to the stdlib json module
+    orjson = None
+
+# Logging is configured by the application entry point, not on import
 logger = logging.getLogger(__name__)
 
 # Define the data file path
 DATA_FILE = "journal_data.json"
 
+def _neg_ts_key(entry: JournalEntry) -> float:
+    """Bisect key: negated timestamps are ascending over a newest-first list."""
+    return -entry.timestamp.timestamp()
+
+
+# Persisted `_type` tag -> entry class
+_CLASS_MAP: dict[str, type] = {
+    cls.__name__: cls for cls in (TaskEntry, EventEntry, NoteEntry, HabitEntry)
+}
+
+# Constructor field names (in declaration order) per persisted entry class,
+# computed once at import and shared by the encoder and decoder
+_FIELD_NAMES: dict[type, tuple[str, ...]] = {
+    cls: tuple(f.name for f in dataclass_fields(cls) if f.init)
+    for cls in _CLASS_MAP.values()
+}
+_VALID_KEYS: dict[str, frozenset[str]] = {
+    cls.__name__: frozenset(names) for cls, names in _FIELD_NAMES.items()
+}
+
+
+
+# Interned decoders: Enum members are immutable, so the handful of repeated
+# symbol strings become cache hits
+@lru_cache(maxsize=16)
+def _parse_signifier(value: str) -> Signifier:
+    return Signifier(value)
+
+@lru_cache(maxsize=16)
+def _parse_status(value: str) -> TaskStatus:
+    return TaskStatus(value)
+
+def _parse_completed_dates(values: List[str]) -> array:
+    # Habit completions are ISO strings on disk but date ordinals in memory
+    return array('i', (date.fromisoformat(d).toordinal() for d in values))
+
+# On-disk key -> (constructor field, decoder) for values that need converting
+_FIELD_DECODERS = {
+    'signifier': ('signifier', _parse_signifier),
+    'status': ('status', _parse_status),
+    'timestamp': ('timestamp', datetime.fromisoformat),
+    'completed_dates': ('completed_ordinals', _parse_completed_dates),
+}
+
 
 # ============================================================================
 # REPOSITORY PATTERN - Interface Definition
@@ -32,11 +84,29 @@ class JournalRepository(Protocol):
         """Load all journal entries from storage."""
         ...
     
+    def _backup_legacy_file(self) -> bool:
+        """Copies the legacy journal to a `.bak` file; returns False if that fails."""
+        backup_path = self.file_path + ".bak"
+        try:
+            shutil.copyfile(self.file_path, backup_path)
+        except OSError as e:
+            logger.error("Not migrating %s: could not back it up to %s: %s", self.file_path, backup_path, e)
+            return False
+        logger.warning("Some entries in %s could not be read; the original is kept in %s",
+                       self.file_path, backup_path)
+        return True
+
     def save_entries(self, entries: List[JournalEntry]) -> None:
         """Save all journal entries to storage."""
         ...
     
-    def find_by_date_range(self, start: datetime, end: datetime) -> List[JournalEntry]:
+    def append_entry(self, entry: JournalEntry) -> None:
+        """Persist a single new entry without rewriting storage."""
+        ...
+    
+    def find_by_date_range(
+        self, start: datetime, end: datetime, entries: Optional[List[JournalEntry]] = None
+    ) -> List[JournalEntry]:
         """Find entries within a specific date range."""
         ...
 
@@ -47,84 +117,249 @@ class JournalRepository(Protocol):
 
 class FileJournalRepository(JournalRepository):
     """Implementation that uses a local JSON file for storage."""
+
+    def __init__(self, file_path: str = DATA_FILE):
+        self.file_path = file_path
+        # Decoded records memoized against the file's (mtime_ns, size); entries
+        # are rebuilt from them on a hit so callers never share instances
+        self._cache: List[dict] | None = None
+        self._cache_key: tuple[int, int] | None = None
+        # Hash of the file contents last read or written, for no-op save detection
+        self._last_hash: int | None = None
+
+    def _stat_key(self) -> tuple[int, int]:
+        """Returns the (mtime_ns, size) pair identifying the file's current contents."""
+        st = os.stat(self.file_path)
+        return (st.st_mtime_ns, st.st_size)
     
     def load_entries(self) -> List[JournalEntry]:
-        """Loads entries from the JSON file."""
+        """Loads entries from the JSON Lines file (migrating a legacy JSON array file)."""
         entries = []
-        if os.path.exists(DATA_FILE):
+        if os.path.exists(self.file_path):
+            cache_key = self._stat_key()
+            if self._cache is not None and cache_key == self._cache_key:
+                # Unchanged since the last load: skip the re-parse
+                return [self._decode_entry(d) for d in self._cache]
+
+            records = []
+            migrate = False
             try:
-                with open(DATA_FILE, 'r') as f:
-                    data = json.load(f)
-                    entries = [self._decode_entry(d) for d in data]
-                logger.info("Successfully loaded %d entries from %s", len(entries), DATA_FILE)
-            except json.JSONDecodeError as e:
-                logger.error("Error decoding JSON from %s: %s", DATA_FILE, e)
+                # Read raw bytes: both parsers take UTF-8 directly, so there is
+                # no intermediate str decode of the document
+                with open(self.file_path, 'rb') as f:
+                    content = f.read()
+                if not content:
+                    logger.info("%s is empty. Starting with empty journal.", self.file_path)
+                    return entries
+
+                if content.lstrip().startswith(b"["):
+                    # Legacy format: the whole journal is a single JSON array
+                    data = _loads(content)
+                    for item_no, d in enumerate(data, start=1):
+                        entry = self._decode_line(d, "item", item_no)
+                        if entry is not None:
+                            entries.append(entry)
+                            records.append(d)
+                    # Rewriting drops any item that failed to decode, so
+                    # keep the original array next to the journal first
+                    migrate = len(entries) == len(data) or self._backup_legacy_file()
+                else:
+                    # One entry per line; a bad line only loses that entry
+                    for line_no, line in enumerate(content.split(b"\n"), start=1):
+                        if not line.strip():
+                            continue
+                        try:
+                            d = _loads(line)
+                        except ValueError as e: # JSONDecodeError, or UnicodeDecodeError on the stdlib path
+                            logger.warning("Skipping unreadable line %d in %s: %s", line_no, self.file_path, e)
+                            continue
+                        entry = self._decode_line(d, "line", line_no)
+                        if entry is not None:
+                            entries.append(entry)
+                            records.append(d)
+                logger.info("Successfully loaded %d entries from %s", len(entries), self.file_path)
+                self._cache, self._cache_key = records, cache_key
+                # For a file this code wrote, the bytes just read are the payload
+                # an unchanged journal re-serializes to, so that save is a no-op
+                self._last_hash = hash(content)
+            except json.JSONDecodeError as e: # orjson.JSONDecodeError subclasses this
+                logger.error("Error decoding JSON from %s: %s", self.file_path, e)
             except Exception as e:
                 logger.error("An unexpected error occurred while loading: %s", e)
+
+            if migrate:
+                # Rewrite once as JSON Lines so later additions can be appended
+                logger.info("Migrating %s to JSON Lines format.", self.file_path)
+                self.save_entries(entries)
         else:
-            logger.info("%s not found. Starting with empty journal.", DATA_FILE)
+            logger.info("%s not found. Starting with empty journal.", self.file_path)
             
         return entries
 
     def save_entries(self, entries: List[JournalEntry]) -> None:
-        """Saves entries to the JSON file."""
+        """Rewrites (compacts) the whole JSON Lines file from the given entries."""
         try:
-            with open(DATA_FILE, 'w') as f:
-                # Use the CustomEncoder for dataclasses and enums
-                json.dump(entries, f, indent=4, cls=CustomEncoder)
-            logger.info("Successfully saved %d entries to %s", len(entries), DATA_FILE)
+            payload = b"".join(_dumps(entry) + b"\n" for entry in entries)
+            payload_hash = hash(payload)
+            if (payload_hash == self._last_hash and self._cache_key is not None
+                    and os.path.exists(self.file_path) and self._stat_key() == self._cache_key):
+                # Byte-identical to what we last wrote and the file is untouched
+                logger.info("No changes to save to %s", self.file_path)
+                return
+            # Write a sibling temp file and swap it in, so a crash mid-write
+            # never leaves a truncated journal behind
+            tmp_path = self.file_path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.file_path)
+            # Keep only the stat key for no-op detection; caching the caller's
+            # (mutable) entries would leak later edits into load_entries
+            self._cache, self._cache_key = None, self._stat_key()
+            self._last_hash = payload_hash
+            logger.info("Successfully saved %d entries to %s", len(entries), self.file_path)
         except Exception as e:
-            logger.error("Error saving entries to %s: %s", DATA_FILE, e)
-
-    def find_by_date_range(self, start: datetime, end: datetime) -> List[JournalEntry]:
-        """Finds entries between start and end dates."""
-        all_entries = self.load_entries()
-        return [
-            entry for entry in all_entries 
-            if start <= entry.timestamp <= end
-        ]
+            logger.error("Error saving entries to %s: %s", self.file_path, e)
+
+    def append_entry(self, entry: JournalEntry) -> None:
+        """Appends a single entry as one JSON line without rewriting the file."""
+        try:
+            with open(self.file_path, 'ab') as f:
+                f.write(_dumps(entry) + b"\n")
+            # The file grew, so the next load_entries re-parses it
+            self._cache = self._cache_key = self._last_hash = None
+            logger.debug("Appended entry to %s", self.file_path)
+        except Exception as e:
+            logger.error("Error appending entry to %s: %s", self.file_path, e)
+
+    def find_by_date_range(
+        self, start: datetime, end: datetime, entries: Optional[List[JournalEntry]] = None
+    ) -> List[JournalEntry]:
+        """
+        Finds entries between start and end dates, newest first.
+
+        Callers that already hold the journal can pass it as `entries` to skip
+        file IO; it must be sorted newest first (as BulletJournalCLI keeps it),
+        since that path bisects instead of scanning.
+        """
+        if entries is None:
+            # The file is in append order, so scan it and sort only the matches
+            matches = (e for e in self.load_entries() if start <= e.timestamp <= end)
+            return sorted(matches, key=TS_KEY, reverse=True)
+
+        lo = bisect_left(entries, -end.timestamp(), key=_neg_ts_key)
+        hi = bisect_right(entries, -start.timestamp(), key=_neg_ts_key)
+        return entries[lo:hi]
 
     # --- Private Decoding Helper ---
 
-    def _decode_entry(self, data: dict) -> JournalEntry:
-        """Converts a dictionary back into the appropriate JournalEntry subclass."""
-        
-        # 1. Extract and remove the type identifier
-        entry_type_name = data.pop("_type", "NoteEntry") 
-        
-        # 2. Decode Enums and Datetime objects
-        if 'signifier' in data:
-            # Recreate Enum from value
-            data['signifier'] = Signifier(data['signifier']) 
+    def _decode_line(self, d: Any, kind: str, number: int) -> Optional[JournalEntry]:
+        """
+        Decodes one parsed line/item, logging and skipping it (returns None)
+        when it is not a valid entry, so one bad record never truncates the load.
+        """
+        if not isinstance(d, dict):
+            logger.warning("Skipping non-object entry on %s %d in %s", kind, number, self.file_path)
+            return None
+        try:
+            return self._decode_entry(d)
+        except (ValueError, TypeError, KeyError) as e:
+            logger.warning("Skipping invalid entry on %s %d in %s: %s", kind, number, self.file_path, e)
+            return None
+
+    def _decode_entry(self, raw: dict) -> Optional[JournalEntry]:
+        """
+        Converts a dictionary back into the appropriate JournalEntry subclass.
+        Returns None (and logs) for unknown entry types.
+        """
         
-        if 'status' in data and entry_type_name == 'TaskEntry':
-            data['status'] = TaskStatus(data['status'])
+        # 1. Read the type identifier without mutating the parsed dict
+        entry_type_name = raw.get("_type", "NoteEntry") 
+        valid_keys = _VALID_KEYS.get(entry_type_name)
+        if valid_keys is None:
+            logger.warning("Skipping entry of unknown type %r in %s", entry_type_name, self.file_path)
+            return None
         
-        if 'timestamp' in data:
-            data['timestamp'] = datetime.fromisoformat(data['timestamp'])
-            
-        # 3. Handle HabitEntry special case for completion dates (list of strings)
-        if entry_type_name == 'HabitEntry' and 'completed_dates' not in data:
-            data['completed_dates'] = []
-
-        # 4. Create the correct class instance
-        if entry_type_name == 'TaskEntry':
-            return TaskEntry(**data)
-        elif entry_type_name == 'EventEntry':
-            return EventEntry(**data)
-        elif entry_type_name == 'HabitEntry':
-            return HabitEntry(**data)
-        elif entry_type_name == 'NoteEntry':
-            return NoteEntry(**data)
-        else:
-            # Fallback for unknown/old types
-            return JournalEntry(type=entry_type_name, **data)
+        # 2. Build the constructor kwargs in one pass: decode Enums, datetimes and
+        #    habit dates, and drop keys the constructor does not accept
+        #    (the `_type` tag, a stray derived `type`, ...)
+        data = {}
+        for key, value in raw.items():
+            field_name, convert = _FIELD_DECODERS.get(key, (key, None))
+            if field_name not in valid_keys:
+                continue
+            data[field_name] = convert(value) if convert else value
+
+        # 3. Create the correct class instance
+        return _CLASS_MAP[entry_type_name](**data)
 
 
 # ============================================================================
 # CUSTOM JSON ENCODER
 # ============================================================================
 
+def _entry_to_dict(o: JournalEntry) -> dict:
+    """Converts an entry to a plain dict tagged with its class name."""
+    # Slotted entries have no __dict__; only constructor fields are
+    # persisted, so derived caches and the fixed `type` are skipped
+    names = _FIELD_NAMES.get(type(o))
+    if names is None:
+        names = [f.name for f in dataclass_fields(o) if f.init]
+    data = {name: getattr(o, name) for name in names}
+    # Habit ordinals are written back as ISO dates (newest first) to keep the file format
+    if "completed_ordinals" in data:
+        data["completed_dates"] = [
+            date.fromordinal(d).isoformat() for d in sorted(data.pop("completed_ordinals"), reverse=True)
+        ]
+    data["_type"] = o.__class__.__name__
+    return data
+
+
+def _default(o: Any) -> Any:
+    """
+    Fallback serializer shared by orjson and CustomEncoder for entries,
+    datetimes and Enums (orjson only ever passes it entries).
+    """
+    # Exact-type dispatch: one hash probe for the common cases
+    handler = _DEFAULT_DISPATCH.get(type(o))
+    if handler is not None:
+        return handler(o)
+
+    # Subclasses not in the table (Enum members, ad-hoc entry types)
+    if isinstance(o, Enum):
+        return o.value
+    if isinstance(o, JournalEntry):
+        return _entry_to_dict(o)
+
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+_DEFAULT_DISPATCH = {
+    datetime: datetime.isoformat,
+    JournalEntry: _entry_to_dict,
+    TaskEntry: _entry_to_dict,
+    EventEntry: _entry_to_dict,
+    NoteEntry: _entry_to_dict,
+    HabitEntry: _entry_to_dict,
+}
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serializes an object to compact single-line JSON bytes."""
+    if orjson:
+        # orjson handles datetime and Enum natively; entries are passed
+        # through to _default so the `_type` tag can be added
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_PASSTHROUGH_DATACLASS)
+    # Compact separators, matching orjson's whitespace-free output
+    return json.dumps(obj, cls=CustomEncoder, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(content: bytes) -> Any:
+    """Parses JSON from UTF-8 bytes."""
+    return orjson.loads(content) if orjson else json.loads(content)
+
+
 class CustomEncoder(json.JSONEncoder):
     """
     Custom JSON Encoder to handle non-standard types (datetime, Enum, dataclass)
@@ -132,35 +367,30 @@ class CustomEncoder(json.JSONEncoder):
     """
     
     def default(self, o: Any) -> Any:
-        # Handle dataclass objects by converting to a dictionary
-        if isinstance(o, JournalEntry):
-            data = o.__dict__.copy()
-            data["_type"] = o.__class__.__name__
-            return data
-
-        # Handle datetime objects
-        if isinstance(o, datetime):
-            return o.isoformat()
-
-        # Handle Enum objects
-        if isinstance(o, Enum):
-            return o.value
-        
-        # Let the base class handle all other types
-        return super().default(o)
+        try:
+            return _default(o)
+        except TypeError:
+            # Let the base class handle all other types
+            return super().default(o)
 
 
 # ============================================================================
 # MODULE-LEVEL FUNCTIONS (Backward Compatibility)
 # ============================================================================
 
-# Create a default repository instance
-_default_repository = FileJournalRepository()
+@lru_cache(maxsize=1)
+def _get_repo() -> FileJournalRepository:
+    """Returns the shared default repository, created on first use."""
+    return FileJournalRepository()
 
 def load_entries() -> List[JournalEntry]:
     """Loads journal entries using the default file repository."""
-    return _default_repository.load_entries()
+    return _get_repo().load_entries()
 
 def save_entries(entries: List[JournalEntry]) -> None:
     """Saves journal entries using the default file repository."""
-    _default_repository.save_entries(entries)
+    _get_repo().save_entries(entries)
+
+def append_entry(entry: JournalEntry) -> None:
+    """Appends a journal entry using the default file repository."""
+    _get_repo().append_entry(entry)
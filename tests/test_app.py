@@ -0,0 +1,113 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+from datetime import date, datetime, time, timedelta
+from unittest import mock
+
+from journal_app.app import BulletJournalCLI
+from journal_app.entry import NoteEntry, TaskEntry, EventEntry, HabitEntry
+
+
+class _MemoryRepository:
+    """In-memory stand-in for FileJournalRepository."""
+
+    def __init__(self, entries):
+        self.entries = list(entries)
+        self.saved = None
+
+    def load_entries(self):
+        return list(self.entries)
+
+    def save_entries(self, entries):
+        self.saved = list(entries)
+
+    def append_entry(self, entry):
+        self.entries.append(entry)
+
+
+class BulletJournalCLITest(unittest.TestCase):
+    """Covers the render caches and the sorted entries/keys invariant."""
+
+    def setUp(self):
+        now = datetime.combine(date.today(), time(12))
+        self.task = TaskEntry(content="task", timestamp=now)
+        self.event = EventEntry(content="event", timestamp=now - timedelta(minutes=1))
+        self.habit = HabitEntry(content="habit", timestamp=now - timedelta(minutes=2))
+        self.app = BulletJournalCLI(_MemoryRepository([self.habit, self.task, self.event]))
+
+    def _run(self, action, *inputs):
+        with mock.patch("builtins.input", side_effect=inputs), redirect_stdout(io.StringIO()):
+            action()
+
+    def _row(self, entry):
+        return self.app._format_entry(entry, self.app.entries.index(entry) + 1)
+
+    def _assert_keys_aligned(self):
+        self.assertEqual(self.app._keys, [-e.timestamp.timestamp() for e in self.app.entries])
+
+    def test_loaded_entries_are_sorted_newest_first(self):
+        self.assertEqual(self.app.entries, [self.task, self.event, self.habit])
+        self._assert_keys_aligned()
+
+    def test_mutations_change_the_rendered_row(self):
+        cases = [
+            (self.task, self.app.complete_task),
+            (self.task, self.app.migrate_task),
+            (self.event, self.app.complete_event),
+            (self.habit, self.app.mark_habit_complete),
+        ]
+        for entry, action in cases:
+            with self.subTest(action=action.__name__):
+                before = self._row(entry)
+                self._run(action, str(self.app.entries.index(entry) + 1))
+                self.assertNotEqual(self._row(entry), before)
+                self.assertEqual(self._row(entry), f"[{self.app.entries.index(entry) + 1:02}] {entry.format_display()}")
+
+    def _weekly_rows_for_today(self):
+        today = date.today()
+        return self.app._cached_view_rows('weekly', today, today, self.app._build_weekly_rows)
+
+    def test_mutations_rebuild_cached_spread_rows(self):
+        before = self._weekly_rows_for_today()
+        self.assertIs(self._weekly_rows_for_today(), before)
+
+        self._run(self.app.complete_task, str(self.app.entries.index(self.task) + 1))
+        self.assertNotEqual(self._weekly_rows_for_today(), before)
+
+    def test_row_cache_is_cleared_when_the_day_rolls_over(self):
+        with redirect_stdout(io.StringIO()):
+            self.app.display_journal()
+        self.app._row_cache[id(self.task)] = "stale"
+        self.app._row_cache_day = date.today() - timedelta(days=1)
+
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.app.display_journal()
+
+        self.assertNotIn("stale", out.getvalue())
+        self.assertEqual(self.app._row_cache_day, date.today())
+
+    def test_out_of_order_insert_keeps_keys_aligned(self):
+        older = NoteEntry(content="older", timestamp=self.event.timestamp - timedelta(seconds=30))
+        oldest = NoteEntry(content="oldest", timestamp=self.habit.timestamp - timedelta(days=1))
+        newest = NoteEntry(content="newest", timestamp=self.task.timestamp + timedelta(seconds=1))
+        for entry in (older, oldest, newest):
+            self.app._insert_entry(entry)
+
+        self.assertEqual(self.app.entries, [newest, self.task, self.event, older, self.habit, oldest])
+        self._assert_keys_aligned()
+
+    def test_entries_between_includes_both_day_edges(self):
+        start, end = date(2024, 3, 4), date(2024, 3, 10)
+        first = NoteEntry(content="first", timestamp=datetime.combine(start, time.min))
+        last = NoteEntry(content="last", timestamp=datetime.combine(end, time.max))
+        before = NoteEntry(content="before", timestamp=datetime.combine(start, time.min) - timedelta(microseconds=1))
+        after = NoteEntry(content="after", timestamp=datetime.combine(end, time.max) + timedelta(microseconds=1))
+        for entry in (first, after, last, before):
+            self.app._insert_entry(entry)
+
+        self.assertEqual(self.app._entries_between(start, end), [first, last])
+
+
+if __name__ == "__main__":
+    unittest.main()
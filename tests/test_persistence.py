@@ -0,0 +1,157 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from datetime import date, datetime
+
+from journal_app.entry import Signifier, TaskStatus, NoteEntry, TaskEntry, HabitEntry
+from journal_app import persistence
+from journal_app.persistence import FileJournalRepository
+
+
+class FileJournalRepositoryTest(unittest.TestCase):
+    """Round-trips the JSON Lines journal file and the legacy array migration."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "journal_data.json")
+        self.repo = FileJournalRepository(file_path=self.path)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _read_lines(self):
+        with open(self.path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def _task(self, content, hour):
+        return TaskEntry(content=content, timestamp=datetime(2024, 5, 1, hour, 30, 0, 123456))
+
+    def test_save_writes_one_entry_per_line(self):
+        entries = [self._task("first", 9), NoteEntry(content="note", timestamp=datetime(2024, 5, 1, 10))]
+        self.repo.save_entries(entries)
+
+        lines = self._read_lines()
+        self.assertEqual([d["_type"] for d in lines], ["TaskEntry", "NoteEntry"])
+        self.assertEqual(FileJournalRepository(file_path=self.path).load_entries(), entries)
+
+    def test_saving_unchanged_entries_after_load_skips_the_write(self):
+        self.repo.save_entries([self._task("late", 11), self._task("early", 9)])
+        for repo in (FileJournalRepository(file_path=self.path), self.repo):
+            before = os.stat(self.path).st_mtime_ns
+            repo.save_entries(repo.load_entries())
+            self.assertEqual(os.stat(self.path).st_mtime_ns, before)
+
+    def test_saving_changed_entries_after_load_writes(self):
+        self.repo.save_entries([self._task("first", 9)])
+        loaded = self.repo.load_entries()
+        loaded[0].complete()
+        self.repo.save_entries(loaded)
+
+        self.assertEqual(self._read_lines()[0]["status"], TaskStatus.COMPLETE.value)
+
+    def test_append_adds_a_line(self):
+        first, second = self._task("first", 9), self._task("second", 11)
+        self.repo.save_entries([first])
+        self.repo.append_entry(second)
+
+        self.assertEqual(len(self._read_lines()), 2)
+        self.assertEqual(self.repo.load_entries(), [first, second])
+
+    def test_habit_round_trip_is_equal(self):
+        habit = HabitEntry(content="run", timestamp=datetime(2024, 5, 1, 7))
+        habit.mark_complete(date(2024, 5, 1))
+        habit.mark_complete(date(2024, 5, 2))
+        self.repo.save_entries([habit])
+
+        loaded = self.repo.load_entries()[0]
+        self.assertEqual(loaded, habit)
+        self.assertTrue(loaded.is_completed_on(date(2024, 5, 2).toordinal()))
+        self.assertEqual(self._read_lines()[0]["completed_dates"], ["2024-05-02", "2024-05-01"])
+
+    def test_find_by_date_range_from_file_order(self):
+        early, middle, late = self._task("early", 8), self._task("middle", 10), self._task("late", 12)
+        self.repo.save_entries([middle, late, early])
+        start, end = datetime(2024, 5, 1, 9), datetime(2024, 5, 1, 13)
+
+        self.assertEqual(self.repo.find_by_date_range(start, end), [late, middle])
+        self.assertEqual(self.repo.find_by_date_range(start, end, [late, middle, early]), [late, middle])
+
+    def test_reload_does_not_share_entries(self):
+        self.repo.save_entries([self._task("first", 9)])
+        loaded = self.repo.load_entries()
+        loaded[0].content = "edited in memory"
+        loaded[0].complete()
+
+        reloaded = self.repo.load_entries()
+        self.assertIsNot(reloaded[0], loaded[0])
+        self.assertEqual(reloaded[0].content, "first")
+        self.assertEqual(reloaded[0].status, TaskStatus.INCOMPLETE)
+
+    def test_bad_lines_do_not_drop_later_entries(self):
+        first, last = self._task("first", 9), self._task("last", 11)
+        self.repo.save_entries([first])
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("{not json\n")
+            f.write(json.dumps({"_type": "TaskEntry", "content": "bad", "signifier": "X",
+                                "timestamp": "2024-05-01T10:00:00"}) + "\n")
+            f.write(json.dumps({"_type": "TaskEntry", "content": "bad", "timestamp": "yesterday"}) + "\n")
+        self.repo.append_entry(last)
+
+        with self.assertLogs("journal_app.persistence", level="WARNING"):
+            loaded = FileJournalRepository(file_path=self.path).load_entries()
+        self.assertEqual(loaded, [first, last])
+
+    @mock.patch.object(persistence, "orjson", None)
+    def test_invalid_utf8_line_is_skipped_without_orjson(self):
+        first, last = self._task("first", 9), self._task("last", 11)
+        self.repo.save_entries([first])
+        with open(self.path, "ab") as f:
+            f.write(b'{"_type": "NoteEntry", "content": "\xff"}\n')
+            f.write(b"[1]\n")
+        self.repo.append_entry(last)
+
+        with self.assertLogs("journal_app.persistence", level="WARNING") as logs:
+            loaded = FileJournalRepository(file_path=self.path).load_entries()
+        self.assertEqual(loaded, [first, last])
+        self.assertEqual(len(logs.records), 2)
+
+    def test_legacy_array_is_migrated(self):
+        legacy = [
+            {"_type": "TaskEntry", "content": "old task", "type": "Task", "signifier": "*",
+             "status": "×", "timestamp": "2023-01-02T08:00:00"},
+            {"_type": "NoteEntry", "content": "old note", "type": "Note", "signifier": "",
+             "timestamp": "2023-01-03T08:00:00"},
+        ]
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(legacy, f, indent=4)
+
+        loaded = self.repo.load_entries()
+
+        self.assertEqual([e.content for e in loaded], ["old task", "old note"])
+        self.assertEqual(loaded[0].signifier, Signifier.PRIORITY)
+        self.assertEqual(loaded[0].status, TaskStatus.COMPLETE)
+        self.assertEqual([d["content"] for d in self._read_lines()], ["old task", "old note"])
+        self.assertFalse(os.path.exists(self.path + ".bak"))
+        self.assertEqual(FileJournalRepository(file_path=self.path).load_entries(), loaded)
+
+    def test_legacy_migration_backs_up_skipped_items(self):
+        legacy = [
+            {"_type": "NoteEntry", "content": "kept", "timestamp": "2023-01-02T08:00:00"},
+            {"_type": "TaskEntry", "content": "bad", "signifier": "X", "timestamp": "2023-01-03T08:00:00"},
+        ]
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(legacy, f)
+
+        with self.assertLogs("journal_app.persistence", level="WARNING"):
+            loaded = self.repo.load_entries()
+
+        self.assertEqual([e.content for e in loaded], ["kept"])
+        with open(self.path + ".bak", encoding="utf-8") as f:
+            self.assertEqual(json.load(f), legacy)
+        self.assertEqual([d["content"] for d in self._read_lines()], ["kept"])
+
+
+if __name__ == "__main__":
+    unittest.main()